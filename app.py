@@ -17,6 +17,9 @@ css = """
     padding: 15px;
     border-radius: 8px;
 }
+.filler-audio {
+    display: none;
+}
 """
 
 header_md = "# 🎙️ Tandem Buddy"
@@ -48,6 +51,15 @@ with gr.Blocks(css=css) as demo:
                 transcribe_toggle = gr.Button("Show Transcriptions", scale=1)
                 feedback_btn = gr.Button("Get Final Feedback", variant="secondary", scale=1)
             
+            # Filler acknowledgements player (rendered but hidden, so autoplay works)
+            filler_audio = gr.Audio(
+                type="filepath",
+                autoplay=True,
+                interactive=False,
+                show_label=False,
+                elem_classes="filler-audio"
+            )
+
             # Feedback Section
             with gr.Row(visible=True) as feedback_row:
                 feedback_display = gr.Markdown(elem_classes="feedback-section")
@@ -70,7 +82,7 @@ with gr.Blocks(css=css) as demo:
     send_btn.click(
         integrated_chat.handle_audio_submit,
         inputs=[audio_input],
-        outputs=[chatbot, transcription_display, audio_input]
+        outputs=[chatbot, transcription_display, audio_input, filler_audio]
     )
 
     # Feedback Button
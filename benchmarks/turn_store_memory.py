@@ -0,0 +1,79 @@
+"""Per-session memory of the conversation state, before and after `TurnStore`.
+
+The "lists" layout reproduces the previous `ChatController` state: two Chatbot
+messages per utterance in `_history`, a dict per utterance in `_transcriptions`
+and a LangChain message history holding the same text a third time. The
+"turn store" layout is the single `TurnStore` that replaces the three of them.
+
+Run from the repository root:
+
+    python benchmarks/turn_store_memory.py
+"""
+import sys
+import pathlib
+import tracemalloc
+
+from langchain_core.chat_history import InMemoryChatMessageHistory
+from langchain_core.messages import HumanMessage, AIMessage
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent.parent))
+
+from tandem_buddy.turn_store import TurnStore
+
+TURN_COUNTS = [10, 100, 1000]
+
+user_text = "Ayer fui al parque con mis amigos y jugamos al fútbol toda la tarde, turno {}."
+assistant_text = ("¡Qué divertido! Se dice 'jugamos al fútbol', muy bien. "
+                  "¿Quién ganó el partido del turno {}?")
+
+
+def build_lists(turns:int) -> tuple:
+    history = []
+    transcriptions = []
+    chat_history = InMemoryChatMessageHistory()
+
+    for index in range(1, turns + 1):
+        for role, template, label in (("user", user_text, "🎤 User"),
+                                      ("assistant", assistant_text, "🤖 Assistant")):
+            text = template.format(index)
+            history.append({"role": role, "content": f"{label} Audio Message #{index}"})
+            history.append({"role": role, "content": {"path": f"temp_data/{role}_audio_{index}.mp3"}})
+            transcriptions.append({"role": role, "text": text, "index": index})
+
+        chat_history.add_messages([HumanMessage(content=transcriptions[-2]["text"]),
+                                   AIMessage(content=transcriptions[-1]["text"])])
+
+    return history, transcriptions, chat_history
+
+
+def build_turn_store(turns:int) -> TurnStore:
+    store = TurnStore()
+
+    for index in range(1, turns + 1):
+        store.add_messages([HumanMessage(content=user_text.format(index)),
+                            AIMessage(content=assistant_text.format(index))])
+
+    return store
+
+
+def measure(build, turns:int) -> int:
+    """Bytes still allocated by the session state once it is built."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    state = build(turns)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del state
+    return after - before
+
+
+if __name__ == "__main__":
+    # Warm up imports and caches so they are not counted in the first measurement
+    build_lists(1)
+    build_turn_store(1)
+
+    print(f"{'turns':>6} | {'lists (bytes)':>14} | {'turn store (bytes)':>18} | {'ratio':>5}")
+    for turns in TURN_COUNTS:
+        lists_bytes = measure(build_lists, turns)
+        store_bytes = measure(build_turn_store, turns)
+        print(f"{turns:>6} | {lists_bytes:>14,} | {store_bytes:>18,} | {lists_bytes / store_bytes:>5.1f}")
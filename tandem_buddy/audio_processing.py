@@ -1,9 +1,11 @@
 import os
 import types
+import hashlib
 from elevenlabs.client import ElevenLabs
 from dotenv import load_dotenv 
 
 from .utils import running_from_docker_container
+from .tracing import get_tracer
 
 class AudioProcessing():
     """A Class for handling audio processing with ElevenLabs API and saving audio files.
@@ -61,11 +63,13 @@ class AudioProcessing():
         if audio_data is None:
             return None        
         
-        transcription = self._client.speech_to_text.convert(
-            file=audio_data,
-            model_id=self._transcription_params["model_id"],
-            language_code=self._transcription_params["language_code"],
-        )    
+        with get_tracer().start_span("stt", {"stt.model": self._transcription_params["model_id"]}) as span:
+            transcription = self._client.speech_to_text.convert(
+                file=audio_data,
+                model_id=self._transcription_params["model_id"],
+                language_code=self._transcription_params["language_code"],
+            )    
+            span.set_attribute("stt.text_length", len(transcription.text))
         
         return transcription.text
 
@@ -90,6 +94,41 @@ class AudioProcessing():
 
         return audio
 
+    def synthesize_fillers(self, texts:list[str], cache_dir:str = "filler_cache") -> list[str]:
+        """Synthesize short filler phrases, reusing the audio cached on disk.
+
+        The audio files are stored per voice, so changing ELEVENLABS_VOICE_ID
+        generates a new pool, and named after the phrase, so only new phrases
+        call the API.
+
+        Args:
+            texts (list[str]): Phrases to synthesize.
+            cache_dir (str, optional): Directory of the audio cache. Defaults to "filler_cache".
+
+        Returns:
+            list[str]: Audio file paths, in the same order as `texts`.
+        """        
+        voice_dir = os.path.join(cache_dir, self._text_to_speech_params["voice_id"])
+
+        if os.path.isdir(voice_dir) is False:
+            os.makedirs(voice_dir)
+
+        paths = []
+
+        for text in texts:
+            digest = hashlib.sha1(text.encode("utf-8")).hexdigest()[:12]
+            filename = os.path.join(voice_dir, f"{digest}.mp3")
+
+            if not os.path.isfile(filename):
+                # Write to a temporary file so an interrupted download is not cached
+                partial_filename = f"{filename}.part"
+                self.save_audio_to_file(self.text_to_speech(text), partial_filename)
+                os.replace(partial_filename, filename)
+
+            paths.append(filename)
+
+        return paths
+
     def save_audio_to_file(self, audio_data:bytes | types.GeneratorType, filename:str) -> None:
         """Save audio data to a file.
 
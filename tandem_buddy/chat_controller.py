@@ -1,9 +1,17 @@
 import os
+import uuid
 import types
+import random
+import contextlib
+from typing import Iterator
 import gradio as gr
 
 from .audio_processing import AudioProcessing
 from .language_partner import LanguagePartner
+from .tracing import get_tracer, profiler_from_env, turn_context
+from .turn_store import TurnStore
+from .prompts import filler_acknowledgements
+from .utils import get_env_variable
 
 empty_transcription_message = "## 📝 Transcriptions\n\nNo messages yet."
 
@@ -14,122 +22,182 @@ class ChatController():
         """Initializes the classes for handling the audio processing
         and llm model that generates the answers. The constructor also
         creates a temporary dir for the audio files stored during the 
-        conversation, initializes the history and transcriptions objects
-        used by the gradio interface, and the state flag for the transcriptions
-        toggle activation. 
+        conversation, initializes the turn store from which the chat history
+        and transcriptions used by the gradio interface are derived, and the
+        state flag for the transcriptions toggle activation. Tracing and the
+        slow turn profiler are configured from environment variables
+        (see `tandem_buddy.tracing`).
+
+        When TANDEM_FILLER_ACKNOWLEDGEMENTS is enabled, a pool of short filler
+        phrases is synthesized (or loaded from the local cache) at startup.
         """        
+        # Single storage for the conversation text, shared with the LLM history
+        self._turns = TurnStore()
+
         self.audio_processor = AudioProcessing()
-        self.language_partner = LanguagePartner()
+        self.language_partner = LanguagePartner(chat_history=self._turns)
 
-        self._message_turn_counter = 1
+        self.tracer = get_tracer()
+        self.profiler = profiler_from_env()
+        self.session_id = uuid.uuid4().hex
 
         if os.path.isdir("temp_data") is False:
             os.makedirs("temp_data")
 
         self.temp_dir = "temp_data"
 
-        self._history = []
-
-        # Transcriptions list (Actual data storage)
-        self._transcriptions = []
-
         # UI State flags
         self.show_transcriptions = False 
+
+        # Filler acknowledgements audio pool
+        self._filler_paths = []
+        self._last_filler_path = None
+
+        if get_env_variable("TANDEM_FILLER_ACKNOWLEDGEMENTS").lower() in ("1", "true", "yes"):
+            try:
+                self._filler_paths = self.audio_processor.synthesize_fillers(filler_acknowledgements)
+            except Exception as e:
+                print(f"Error generating filler acknowledgements: {e}")
+
+    @property
+    def _next_turn_index(self) -> int:
+        """Index of the next conversation turn, starting at 1.
+        """        
+        return len(self._turns) + 1
+
+    def _audio_path(self, role: str, turn_index: int) -> str:
+        """Path of the audio file of an utterance.
+
+        Args:
+            role (str): "user" or "assistant".
+            turn_index (int): Index of the conversation turn.
+
+        Returns:
+            str: Audio file path inside the temporary directory.
+        """        
+        return f"{self.temp_dir}/{role}_audio_{turn_index}.mp3"
+
+    def _chatbot_messages(self) -> list[dict]:
+        """Build the messages displayed by the gradio Chatbot.
+
+        Each utterance is shown as a label message followed by its audio.
+        Utterances whose audio file is missing are skipped.
+
+        Returns:
+            list[dict]: Chatbot messages in the gradio "messages" format.
+        """        
+        messages = []
+
+        for index, role, _ in self._turns.utterances():
+            audio_path = self._audio_path(role, index)
+            if not os.path.isfile(audio_path):
+                continue
+
+            label = "🎤 User" if role == "user" else "🤖 Assistant"
+
+            # Add identifier to the message
+            messages.append({
+                "role": role,
+                "content": f"{label} Audio Message #{index}"
+            })
+
+            messages.append({
+                "role": role,
+                "content": {
+                    "path": audio_path,
+                }
+            })
+
+        return messages
             
-    def _process_user_audio_message(self, audio: bytes | types.GeneratorType) -> None:
+    def _next_filler(self) -> str | None:
+        """Pick the filler acknowledgement to play for the next turn.
+
+        The previous filler is never repeated, so the audio component sees a new
+        value and plays it again.
+
+        Returns:
+            str | None: Path of the filler audio, None if fillers are disabled.
+        """        
+        if not self._filler_paths:
+            return None
+
+        candidates = [path for path in self._filler_paths if path != self._last_filler_path]
+        self._last_filler_path = random.choice(candidates or self._filler_paths)
+
+        return self._last_filler_path
+
+    def _process_user_audio_message(self, audio: bytes | types.GeneratorType, turn_index: int) -> str | None:
         """Process the audio for the user's message
 
-        Saves the audio in a temporary directory, gets the message transcription and saves
-         to the history with the appropriate user tag.
+        Saves the audio in a temporary directory and gets the message transcription.
 
         Args:
             audio (bytes | types.GeneratorType): User's audio input message.
+            turn_index (int): Index of the conversation turn.
 
         Returns:
-            None: Does not return anything.
+            str | None: Transcription of the message, None if there is no audio.
         """        
 
         if audio is None:
             return None
         
         # save user audio in temp file
-        filename = f"{self.temp_dir}/user_audio_{self._message_turn_counter}.mp3"
-        self.audio_processor.save_audio_to_file(audio_data=audio,
-                                                filename=filename)
-
-        # obtain answer from language partner
-        transcription = self.audio_processor.speech_to_text(audio)
-    
-        # Add identifier to the message
-        self._history.append({
-        "role": "user",
-        "content": f"🎤 User Audio Message #{self._message_turn_counter}"
-        })
-
-        self._history.append({
-            "role": "user",
-            "content": {
-                "path": filename,
-            }
-        })
-        
-        # Store transcription
-        self._transcriptions.append({
-            "role": "user",
-            "text": transcription,
-            "index": self._message_turn_counter
-        })
+        filename = self._audio_path("user", turn_index)
+        with self.tracer.start_span("audio_persist", {"audio.path": filename}):
+            self.audio_processor.save_audio_to_file(audio_data=audio,
+                                                    filename=filename)
+
+        return self.audio_processor.speech_to_text(audio)
         
-    def _generate_bot_audio_response(self) -> None:
+    def _generate_bot_audio_response(self, user_transcription: str, turn_index: int) -> None:
         """Generates response to the user's audio transcription
 
         Generates a text response for the user's audio, transforms the text into audio
-        and saves the audio in a temporary directory. Later, adds the transcription 
-        to the history with the appropriate user tag.
+        and saves the audio in a temporary directory. Both transcriptions are stored
+        in the turn store by the language partner's history, and removed again if the
+        audio cannot be generated, so the turn is either complete or not stored.
+
+        Args:
+            user_transcription (str): Transcription of the user's message.
+            turn_index (int): Index of the conversation turn.
         """        
-        # Get user's last transcription
-        user_transcription = self._transcriptions[-1]["text"]
-        
         # Generate assistant response text
         assistant_response_text = self.language_partner.get_response(user_transcription)
 
-        # Generate assistant response text
-        audio_response = self.audio_processor.text_to_speech(assistant_response_text)
-        
-        # save assistant audio in temp file
-        filename = f"{self.temp_dir}/assistant_audio_{self._message_turn_counter}.mp3"
-        self.audio_processor.save_audio_to_file(audio_data=audio_response,
-                                                            filename=filename)
-
-        # Add identifier to the message
-        self._history.append({
-        "role": "assistant",
-        "content": f"🤖 Assistant Audio Message #{self._message_turn_counter}"
-        })
-
-        self._history.append({
-            "role": "assistant",
-            "content": {
-                "path": filename,
-            }
-        })
-        
-        # Store assistant transcription
-        self._transcriptions.append({
-            "role": "assistant",
-            "text": assistant_response_text,
-            "index": self._message_turn_counter
-        })
+        # The speech is streamed lazily and synthesized while it is written
+        # to the temp file, so the span covers both
+        filename = self._audio_path("assistant", turn_index)
+        try:
+            with self.tracer.start_span("tts", {"tts.text_length": len(assistant_response_text),
+                                                "audio.path": filename}):
+                # Generate assistant response audio
+                audio_response = self.audio_processor.text_to_speech(assistant_response_text)
+                
+                # save assistant audio in temp file
+                self.audio_processor.save_audio_to_file(audio_data=audio_response,
+                                                                    filename=filename)
+        except Exception:
+            # Drop the partial turn so the chat never points at missing audio
+            self._turns.remove_last_turn()
+            if os.path.isfile(filename):
+                os.unlink(filename)
+            raise
         
     def process_conversation_turn(self, audio: bytes | types.GeneratorType) -> None:
         """Process a full conversation turn: user audio and bot response audio"""
 
-        # Process user audio message
-        self._process_user_audio_message(audio)
-        self._generate_bot_audio_response()
+        turn_index = self._next_turn_index
+
+        with turn_context(self.session_id, turn_index), \
+             self.tracer.start_span("process_conversation_turn"):
+            # Process user audio message
+            user_transcription = self._process_user_audio_message(audio, turn_index)
 
-        # Generate response audio
-        self._message_turn_counter += 1
+            # Generate response audio
+            if user_transcription is not None:
+                self._generate_bot_audio_response(user_transcription, turn_index)
 
     def clear_all(self) -> tuple[list, str, str]:
         """Clears all content related to the chat history.
@@ -141,10 +209,12 @@ class ChatController():
             - empty string for feedback.
         """        
 
-        self._history = []
-        self._transcriptions = []
+        # Also clears the turn store, which is the language partner's history
         self.language_partner.reset_conversation()
 
+        # Turn ids restart from 1, so traces of the cleared chat get a new session
+        self.session_id = uuid.uuid4().hex
+
         # Clear temp files
         for filename in os.listdir(self.temp_dir):
             file_path = os.path.join(self.temp_dir, filename)
@@ -153,8 +223,6 @@ class ChatController():
                     os.unlink(file_path)
             except Exception as e:
                 print(f"Error deleting file {file_path}: {e}")
-        
-        self._message_turn_counter = 1
 
         # Return empty list for Chatbot, empty string for transcriptions, and empty string for feedback
         return [], empty_transcription_message, ""
@@ -166,17 +234,16 @@ class ChatController():
             str: Formatted transcriptions.
         """        
         
-        if not self.show_transcriptions or not self._transcriptions:
+        if not self.show_transcriptions or not self._turns:
             return ""
         
         formatted = "## 📝 Transcriptions\n\n"
         
-        for i, trans in enumerate(self._transcriptions):
-            role_emoji = "🎤" if trans["role"] == "user" else "🤖"
-            role_name = "User" if trans["role"] == "user" else "Assistant"
-            idx = trans.get('index', i + 1)
+        for idx, role, text in self._turns.utterances():
+            role_emoji = "🎤" if role == "user" else "🤖"
+            role_name = "User" if role == "user" else "Assistant"
             formatted += f"**{role_emoji} {role_name} Audio Message #{idx}**\n\n"
-            formatted += f"{trans['text']}\n\n"
+            formatted += f"{text}\n\n"
             formatted += "---\n\n"
         
         return formatted
@@ -211,40 +278,77 @@ class ChatController():
         Returns:
             str: Formatted detailed feedback.
         """        
-        if not self._transcriptions:
+        if not self._turns:
             return "## ⚠️ No conversation to analyze yet."
         
         feedback = "## 📊 Final Conversation Feedback\n\n"
-        feedback += f"**Total Interactions:** {self._message_turn_counter} turns\n\n"    
+        feedback += f"**Total Interactions:** {len(self._turns)} turns\n\n"    
         feedback+=self.language_partner.get_detailed_feedback()
         
         return feedback
 
-    def handle_audio_submit(self, audio_filepath: str) -> tuple[list, list, None]:
+    def handle_audio_submit(self, audio_filepath: str) -> Iterator[tuple[list, str, None, str | None]]:
         """Handles the complete conversation interaction for the turn 
 
+        When filler acknowledgements are enabled, a first update plays a filler
+        while the reply is generated.
+
         Args:
             audio_filepath (str): Filepath in which the audio is temporarily stored
             by gradio.
 
-        Returns:
-            tuple[list, list, None]: A tuple containing:
+        Yields:
+            tuple[list, str, None, str | None]: A tuple containing:
             - History (for chatbot),
             - Transcription (for panel)
             - None (to clear audio input)
+            - Filler audio path (for the filler player)
         """        
         # Handle audio submission
         if audio_filepath is None:
-            return self._history, self._format_transcriptions(), audio_filepath
+            yield self._chatbot_messages(), self._format_transcriptions(), audio_filepath, gr.update()
+            return
+
+        filler_path = self._next_filler()
+        if filler_path is not None:
+            yield gr.update(), gr.update(), gr.update(), filler_path
         
-        with open(audio_filepath, "rb") as f:
-            audio = f.read()
+        turn_id = self._next_turn_index
+
+        with turn_context(self.session_id, turn_id), \
+             self.tracer.start_span("conversation_turn") as turn_span, \
+             self._profile_turn(turn_id, turn_span):
+
+            with self.tracer.start_span("audio_read") as span:
+                with open(audio_filepath, "rb") as f:
+                    audio = f.read()
+                span.set_attribute("audio.bytes", len(audio))
+
             self.process_conversation_turn(audio)
 
-        # Update transcription display
-        transcription_display = self._format_transcriptions()
+            # Update chat and transcription display
+            with self.tracer.start_span("ui_render"):
+                chatbot_messages = self._chatbot_messages()
+                transcription_display = self._format_transcriptions()
 
-        if not transcription_display and self.show_transcriptions:
-            transcription_display = empty_transcription_message
+                if not transcription_display and self.show_transcriptions:
+                    transcription_display = empty_transcription_message
         
-        return self._history, transcription_display, None
+        # Keep the filler player untouched so a filler still playing is not cut
+        yield chatbot_messages, transcription_display, None, gr.update()
+
+    def _profile_turn(self, turn_id: int, span) -> contextlib.AbstractContextManager:
+        """Sample the turn with the slow turn profiler, if enabled.
+
+        Args:
+            turn_id (int): Index of the profiled turn.
+            span (Span): Turn span on which the profile path is recorded.
+
+        Returns:
+            contextlib.AbstractContextManager: Profiling context, or a no-op context
+            when the profiler is disabled.
+        """        
+        if self.profiler is None:
+            return contextlib.nullcontext()
+
+        return self.profiler.profile(f"{self.session_id}_turn_{turn_id}", span)
@@ -2,19 +2,21 @@ import os
 from dotenv import load_dotenv 
 
 from langchain_openai import ChatOpenAI
-from langchain_community.chat_message_histories import ChatMessageHistory
+from langchain_core.chat_history import BaseChatMessageHistory
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.runnables.history import RunnableWithMessageHistory
-from langchain_core.output_parsers import StrOutputParser
 
 from .prompts import system_prompt, feedback_request_prompt
 from .utils import running_from_docker_container
+from .tracing import get_tracer, current_turn
+from .turn_store import TurnStore
 
 
 # Tandem Buddy Language Partner Class        
 class LanguagePartner():
 
-    def __init__(self, model_name:str ="gpt-4o-mini", system_prompt:str=system_prompt) -> None:
+    def __init__(self, model_name:str ="gpt-4o-mini", system_prompt:str=system_prompt,
+                 chat_history:BaseChatMessageHistory | None = None) -> None:
         """Initialize the Language Partner class.
 
         The constructor sets up the chat model, message history, and conversation chain.
@@ -23,6 +25,8 @@ class LanguagePartner():
             model_name (str, optional): OpenAI model name. Defaults to "gpt-4o-mini".
             system_prompt (str, optional): System Prompt used as imput for the model.
              Defaults to system_prompt.
+            chat_history (BaseChatMessageHistory | None, optional): History in which the
+             conversation is stored. Defaults to None, which creates a new `TurnStore`.
 
         Raises:
             ValueError: OPENAI_API_KEY not found
@@ -40,7 +44,7 @@ class LanguagePartner():
 
         self.model_name = model_name
         self.chat_model = ChatOpenAI(model=self.model_name)
-        self.chat_history = ChatMessageHistory()
+        self.chat_history = chat_history if chat_history is not None else TurnStore()
         
         prompt = ChatPromptTemplate.from_messages([
             ("system", self.system_prompt),
@@ -48,11 +52,12 @@ class LanguagePartner():
             ChatPromptTemplate.from_template("{input}")
         ])
 
-        # Create chain
-        chain = prompt | self.chat_model | StrOutputParser()
+        # Create chain. The model output is kept as a message (instead of parsed
+        # to a string) so the token usage can be recorded in the trace.
+        self._chain = prompt | self.chat_model
 
         self.conversation_chain = RunnableWithMessageHistory(
-            chain,
+            self._chain,
             lambda session_id: self.chat_history,
             input_messages_key="input",
             history_messages_key="history",
@@ -67,20 +72,50 @@ class LanguagePartner():
         Returns:
             str: The model's response to the user's input in text format.
         """        
-        response = self.conversation_chain.invoke(
-            {"input": user_input},
-            config={"configurable": {"session_id": "default"}}
-        )
-        return response
+        return self._invoke(self.conversation_chain, {"input": user_input})
+
+    def _invoke(self, runnable, inputs:dict) -> str:
+        """Invoke a chain and record the LLM call in the trace.
+
+        Args:
+            runnable: Chain to invoke.
+            inputs (dict): Chain inputs.
+
+        Returns:
+            str: Text of the model's response.
+        """        
+        session_id, turn_id = current_turn()
+
+        with get_tracer().start_span("llm", {"llm.model": self.model_name}) as span:
+            response = runnable.invoke(
+                inputs,
+                config={
+                    "configurable": {"session_id": session_id or "default"},
+                    "metadata": {"session_id": session_id, "turn_id": turn_id},
+                }
+            )
+
+            usage = response.usage_metadata or {}
+            span.set_attribute("llm.input_tokens", usage.get("input_tokens"))
+            span.set_attribute("llm.output_tokens", usage.get("output_tokens"))
+            span.set_attribute("llm.total_tokens", usage.get("total_tokens"))
+
+        return response.content
     
     def get_detailed_feedback(self):
         """Provide detailed feedback on the user's performance
         during the conversation.
 
+        The feedback request and answer are not added to the history, which
+        only holds the conversation turns.
+
         Returns:
             str: Detailed feedback on the conversation so far.
         """        
-        return self.get_response(feedback_request_prompt)
+        return self._invoke(self._chain, {
+            "input": feedback_request_prompt,
+            "history": self.chat_history.messages,
+        })
     
     def reset_conversation(self):
         """Reset the conversation history.
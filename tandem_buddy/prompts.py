@@ -34,6 +34,15 @@ Your responsibilities:
 
 Be encouraging, pedagogically sound, and precise in your assessments."""
 
+# Short backchannels played while the reply is being generated
+filler_acknowledgements = [
+   "Mmm, vale…",
+   "¡Qué interesante!",
+   "Ajá, ya veo…",
+   "A ver, a ver…",
+   "¡Anda, mira!",
+]
+
 # Feedback prompt generation
 def get_next_level(user_level):
    levels = ["A1", "A2", "B1", "B2", "C1", "C2"]
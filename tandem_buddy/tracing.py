@@ -0,0 +1,434 @@
+import os
+import sys
+import json
+import time
+import queue
+import secrets
+import threading
+import contextvars
+from collections import Counter
+from contextlib import contextmanager
+
+from .utils import get_env_variable
+
+# Span of the innermost active `start_span` block in the current context
+_current_span = contextvars.ContextVar("tandem_buddy_current_span", default=None)
+
+# (session id, turn id) of the conversation turn being processed in the current context
+_current_turn = contextvars.ContextVar("tandem_buddy_current_turn", default=(None, None))
+
+
+@contextmanager
+def turn_context(session_id:str, turn_id:int):
+    """Mark the block as belonging to a conversation turn.
+
+    Spans opened inside the block, and the LLM calls made by `LanguagePartner`,
+    are tagged with the session and turn ids.
+
+    Args:
+        session_id (str): Id of the chat session.
+        turn_id (int): Index of the turn inside the session.
+
+    Yields:
+        None
+    """
+    token = _current_turn.set((session_id, turn_id))
+    try:
+        yield
+    finally:
+        _current_turn.reset(token)
+
+
+def current_turn() -> tuple[str | None, int | None]:
+    """Return the ids of the conversation turn being processed.
+
+    Returns:
+        tuple[str | None, int | None]: Session id and turn id, (None, None) outside a turn.
+    """
+    return _current_turn.get()
+
+
+class Span():
+    """A single timed operation inside a conversation turn.
+
+    Spans follow the OpenTelemetry data model (trace id, span id, parent span id,
+    attributes and status) so they can be written to a local file or converted
+    and sent to an OTLP collector.
+    """
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_span_id",
+                 "start_time_ns", "end_time_ns", "attributes", "status")
+
+    def __init__(self, name:str, trace_id:int, parent_span_id:int | None, attributes:dict) -> None:
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.randbits(64)
+        self.parent_span_id = parent_span_id
+        self.start_time_ns = time.time_ns()
+        self.end_time_ns = None
+        self.attributes = attributes
+        self.status = "ok"
+
+    def set_attribute(self, key:str, value) -> None:
+        """Set an attribute on the span.
+
+        Args:
+            key (str): Attribute name, e.g. "llm.input_tokens".
+            value: Attribute value. None values are ignored.
+        """
+        if value is not None:
+            self.attributes[key] = value
+
+    @property
+    def duration_ms(self) -> float:
+        """Span duration in milliseconds (0 while the span is still open)."""
+        if self.end_time_ns is None:
+            return 0.0
+        return (self.end_time_ns - self.start_time_ns) / 1e6
+
+    def to_dict(self) -> dict:
+        """Serialize the span to a JSON friendly dictionary.
+
+        Returns:
+            dict: Span fields with hex encoded ids.
+        """
+        return {
+            "name": self.name,
+            "trace_id": f"{self.trace_id:032x}",
+            "span_id": f"{self.span_id:016x}",
+            "parent_span_id": f"{self.parent_span_id:016x}" if self.parent_span_id else None,
+            "start_time_ns": self.start_time_ns,
+            "end_time_ns": self.end_time_ns,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "attributes": self.attributes,
+        }
+
+
+class _NoopSpan():
+    """Stand-in yielded by a disabled tracer so callers never need to check for None."""
+
+    __slots__ = ()
+
+    def set_attribute(self, key:str, value) -> None:
+        pass
+
+
+_NOOP_SPAN = _NoopSpan()
+
+
+class JsonFileSpanExporter():
+    """Append finished spans to a local JSON lines file, one span per line."""
+
+    def __init__(self, filename:str) -> None:
+        directory = os.path.dirname(filename)
+        if directory and os.path.isdir(directory) is False:
+            os.makedirs(directory)
+
+        self.filename = filename
+        self._lock = threading.Lock()
+
+    def export(self, spans:list[Span]) -> None:
+        lines = "".join(json.dumps(span.to_dict(), ensure_ascii=False) + "\n" for span in spans)
+        with self._lock:
+            with open(self.filename, "a", encoding="utf-8") as out_file:
+                out_file.write(lines)
+
+
+class OTLPSpanExporter():
+    """Send finished spans to an OTLP collector over HTTP.
+
+    Requires the optional `tracing` dependencies. The collector endpoint is read
+    by OpenTelemetry from the standard `OTEL_EXPORTER_OTLP_ENDPOINT` or
+    `OTEL_EXPORTER_OTLP_TRACES_ENDPOINT` environment variables.
+    """
+
+    def __init__(self, service_name:str = "tandem-buddy") -> None:
+        """Create the OpenTelemetry exporter.
+
+        Raises:
+            ImportError: opentelemetry packages are not installed
+        """
+        try:
+            from opentelemetry.exporter.otlp.proto.http.trace_exporter import OTLPSpanExporter as _Exporter
+            from opentelemetry.sdk.resources import Resource
+            from opentelemetry.sdk.trace import ReadableSpan
+            from opentelemetry.trace import SpanContext, TraceFlags, Status, StatusCode
+        except ImportError as e:
+            raise ImportError(
+                "OTLP tracing requires the optional dependencies: pip install 'tandem-buddy[tracing]'"
+            ) from e
+
+        self._exporter = _Exporter()
+        self._resource = Resource.create({"service.name": service_name})
+        self._readable_span = ReadableSpan
+        self._span_context = SpanContext
+        self._trace_flags = TraceFlags(TraceFlags.SAMPLED)
+        self._status = Status
+        self._status_code = StatusCode
+
+    def _convert(self, span:Span):
+        parent = None
+        if span.parent_span_id:
+            parent = self._span_context(span.trace_id, span.parent_span_id,
+                                        is_remote=False, trace_flags=self._trace_flags)
+
+        status_code = self._status_code.ERROR if span.status == "error" else self._status_code.OK
+
+        return self._readable_span(
+            name=span.name,
+            context=self._span_context(span.trace_id, span.span_id,
+                                       is_remote=False, trace_flags=self._trace_flags),
+            parent=parent,
+            resource=self._resource,
+            attributes=span.attributes,
+            start_time=span.start_time_ns,
+            end_time=span.end_time_ns,
+            status=self._status(status_code),
+        )
+
+    def export(self, spans:list[Span]) -> None:
+        self._exporter.export([self._convert(span) for span in spans])
+
+
+class Tracer():
+    """Creates nested spans for a conversation turn and exports them.
+
+    The active span is tracked with a context variable, so `AudioProcessing` and
+    `LanguagePartner` only have to open a span for it to be attached to the running
+    turn. Spans of a trace are buffered until the root span ends, and then exported
+    by a background thread so a slow exporter never delays the turn.
+    """
+
+    def __init__(self, exporter=None, max_queued_traces:int = 100) -> None:
+        """Initialize the tracer.
+
+        Args:
+            exporter (optional): Object with an `export(spans)` method.
+             Defaults to None, which disables tracing.
+            max_queued_traces (int, optional): Traces waiting to be exported before
+             new ones are dropped. Defaults to 100.
+        """
+        self.exporter = exporter
+        self._finished = {}
+        self._lock = threading.Lock()
+        self._export_queue = queue.Queue(maxsize=max_queued_traces)
+        self._export_thread = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @contextmanager
+    def start_span(self, name:str, attributes:dict | None = None):
+        """Open a span as a child of the current span.
+
+        The `session.id` and `turn.id` of the active `turn_context` are added
+        to the span attributes.
+
+        Args:
+            name (str): Span name, e.g. "stt" or "llm".
+            attributes (dict | None, optional): Initial span attributes. Defaults to None.
+
+        Yields:
+            Span: The open span (a no-op span when tracing is disabled).
+        """
+        if not self.enabled:
+            yield _NOOP_SPAN
+            return
+
+        parent = _current_span.get()
+        if parent is None:
+            trace_id = secrets.randbits(128)
+            parent_span_id = None
+        else:
+            trace_id = parent.trace_id
+            parent_span_id = parent.span_id
+
+        span = Span(name, trace_id, parent_span_id, {})
+        session_id, turn_id = current_turn()
+        span.set_attribute("session.id", session_id)
+        span.set_attribute("turn.id", turn_id)
+        for key, value in (attributes or {}).items():
+            span.set_attribute(key, value)
+
+        token = _current_span.set(span)
+
+        try:
+            yield span
+        except BaseException as e:
+            span.status = "error"
+            span.set_attribute("exception.type", type(e).__name__)
+            span.set_attribute("exception.message", str(e))
+            raise
+        finally:
+            span.end_time_ns = time.time_ns()
+            _current_span.reset(token)
+            self._finish(span)
+
+    def _finish(self, span:Span) -> None:
+        with self._lock:
+            spans = self._finished.setdefault(span.trace_id, [])
+            spans.append(span)
+            if span.parent_span_id is not None:
+                return
+            del self._finished[span.trace_id]
+
+            if self._export_thread is None:
+                self._export_thread = threading.Thread(target=self._export_loop,
+                                                       name="tandem-buddy-tracer", daemon=True)
+                self._export_thread.start()
+
+        try:
+            self._export_queue.put_nowait(spans)
+        except queue.Full:
+            print(f"Export queue full, dropping {len(spans)} spans")
+
+    def _export_loop(self) -> None:
+        while True:
+            spans = self._export_queue.get()
+            try:
+                self.exporter.export(spans)
+            except Exception as e:
+                print(f"Error exporting {len(spans)} spans: {e}")
+            finally:
+                self._export_queue.task_done()
+
+    def flush(self) -> None:
+        """Block until all the finished traces have been exported.
+        """
+        self._export_queue.join()
+
+
+class SlowTurnProfiler():
+    """Sampling profiler that dumps a flame graph for slow conversation turns.
+
+    While active, a background thread periodically samples the call stack of the
+    thread that started the profiler. If the profiled block takes longer than the
+    threshold, the samples are written in the collapsed stack format
+    ("frame;frame;frame count"), which can be opened directly in speedscope or
+    rendered to SVG with flamegraph.pl / inferno.
+    """
+
+    def __init__(self, threshold_seconds:float, output_dir:str, interval_seconds:float = 0.005) -> None:
+        """Initialize the profiler.
+
+        Args:
+            threshold_seconds (float): Minimum block duration for a profile to be written.
+            output_dir (str): Directory in which the collapsed stack files are saved.
+            interval_seconds (float, optional): Time between samples. Defaults to 0.005.
+        """
+        if os.path.isdir(output_dir) is False:
+            os.makedirs(output_dir)
+
+        self.threshold_seconds = threshold_seconds
+        self.output_dir = output_dir
+        self.interval_seconds = interval_seconds
+
+    @staticmethod
+    def _collapse(frame) -> str:
+        stack = []
+        while frame is not None:
+            code = frame.f_code
+            stack.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})")
+            frame = frame.f_back
+        return ";".join(reversed(stack))
+
+    @contextmanager
+    def profile(self, name:str, span:Span = _NOOP_SPAN):
+        """Sample the current thread while the block runs.
+
+        Args:
+            name (str): Base name of the output file, e.g. "<session>_turn_3".
+            span (Span, optional): Span on which the profile path is recorded.
+             Defaults to a no-op span.
+
+        Yields:
+            None
+        """
+        target_thread = threading.get_ident()
+        samples = Counter()
+        stop = threading.Event()
+
+        def sample() -> None:
+            while not stop.wait(self.interval_seconds):
+                frame = sys._current_frames().get(target_thread)
+                if frame is not None:
+                    samples[self._collapse(frame)] += 1
+
+        sampler = threading.Thread(target=sample, name="tandem-buddy-profiler", daemon=True)
+        start = time.perf_counter()
+        sampler.start()
+
+        try:
+            yield
+        finally:
+            stop.set()
+            sampler.join()
+            elapsed = time.perf_counter() - start
+
+            if elapsed >= self.threshold_seconds and samples:
+                filename = os.path.join(self.output_dir, f"{name}.folded")
+                with open(filename, "w", encoding="utf-8") as out_file:
+                    for stack, count in samples.most_common():
+                        out_file.write(f"{stack} {count}\n")
+
+                span.set_attribute("profile.path", filename)
+
+
+def tracer_from_env() -> Tracer:
+    """Create a tracer from environment variables.
+
+    TANDEM_TRACE_EXPORTER selects the exporter: "file" (JSON lines written to
+    TANDEM_TRACE_FILE, defaults to "traces/spans.jsonl"), "otlp", or empty to
+    disable tracing.
+
+    Raises:
+        ValueError: Unknown TANDEM_TRACE_EXPORTER value
+
+    Returns:
+        Tracer: Configured tracer.
+    """
+    exporter_name = get_env_variable("TANDEM_TRACE_EXPORTER").lower()
+
+    if not exporter_name:
+        return Tracer()
+
+    if exporter_name == "file":
+        return Tracer(JsonFileSpanExporter(get_env_variable("TANDEM_TRACE_FILE", "traces/spans.jsonl")))
+
+    if exporter_name == "otlp":
+        return Tracer(OTLPSpanExporter())
+
+    raise ValueError(f"Unknown TANDEM_TRACE_EXPORTER: {exporter_name}")
+
+
+def profiler_from_env() -> SlowTurnProfiler | None:
+    """Create the slow turn profiler from environment variables.
+
+    The profiler is opt-in: it is only enabled when TANDEM_PROFILE_SLOW_TURN_SECONDS
+    is set. Profiles are written to TANDEM_PROFILE_DIR (defaults to "traces/profiles").
+
+    Returns:
+        SlowTurnProfiler | None: Configured profiler, or None when disabled.
+    """
+    threshold = get_env_variable("TANDEM_PROFILE_SLOW_TURN_SECONDS")
+
+    if not threshold:
+        return None
+
+    return SlowTurnProfiler(float(threshold), get_env_variable("TANDEM_PROFILE_DIR", "traces/profiles"))
+
+
+_tracer = None
+
+def get_tracer() -> Tracer:
+    """Return the process wide tracer, creating it from the environment on first use.
+
+    Returns:
+        Tracer: Shared tracer.
+    """
+    global _tracer
+    if _tracer is None:
+        _tracer = tracer_from_env()
+    return _tracer
@@ -0,0 +1,91 @@
+from typing import Iterator, Sequence
+
+from langchain_core.chat_history import BaseChatMessageHistory
+from langchain_core.messages import BaseMessage, HumanMessage, AIMessage
+
+
+class TurnStore(BaseChatMessageHistory):
+    """Compact storage for the utterances of a conversation.
+
+    The store keeps a single list with the text of every utterance, alternating
+    user and assistant messages, so the role and turn index of each utterance are
+    given by its position. Everything else the chat needs (Gradio Chatbot messages,
+    transcription panel, LLM history) is derived from it on demand instead of being
+    stored as separate copies.
+
+    The store is also the chat message history of `LanguagePartner`: the
+    conversation chain appends each user input and model reply through
+    `add_messages`, and reads the history back through `messages`.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty store.
+        """
+        self._texts = []
+
+    def __len__(self) -> int:
+        """Number of complete turns (user message and assistant reply) stored.
+        """
+        return len(self._texts) // 2
+
+    @property
+    def messages(self) -> list[BaseMessage]:
+        """LLM history view of the stored utterances.
+
+        Returns:
+            list[BaseMessage]: Alternating human and AI messages.
+        """
+        return [
+            HumanMessage(content=text) if role == "user" else AIMessage(content=text)
+            for _, role, text in self.utterances()
+        ]
+
+    def add_messages(self, messages: Sequence[BaseMessage]) -> None:
+        """Store the text of the messages.
+
+        Args:
+            messages (Sequence[BaseMessage]): Human and AI messages, in
+             conversation order.
+
+        Raises:
+            ValueError: A message is not the expected type for its utterance.
+             Nothing is stored in that case.
+        """
+        # Validate the whole batch first so a bad sequence leaves the store untouched
+        for position, message in enumerate(messages, start=len(self._texts)):
+            expected = HumanMessage if position % 2 == 0 else AIMessage
+
+            if not isinstance(message, expected):
+                raise ValueError(
+                    f"Expected {expected.__name__} for utterance {position + 1}, "
+                    f"got {type(message).__name__}"
+                )
+
+        self._texts.extend(str(message.text) for message in messages)
+
+    def remove_last_turn(self) -> None:
+        """Remove the last complete turn (user message and assistant reply).
+
+        Raises:
+            ValueError: There is no complete turn to remove.
+        """
+        if len(self) == 0:
+            raise ValueError("No complete turn to remove")
+
+        del self._texts[len(self) * 2 - 2:]
+
+    def clear(self) -> None:
+        """Remove all the stored utterances.
+        """
+        self._texts = []
+
+    def utterances(self) -> Iterator[tuple[int, str, str]]:
+        """Iterate over the stored utterances.
+
+        Yields:
+            tuple[int, str, str]: Turn index (starting at 1), role ("user" or
+            "assistant") and text of each utterance.
+        """
+        for position, text in enumerate(self._texts):
+            role = "user" if position % 2 == 0 else "assistant"
+            yield position // 2 + 1, role, text
@@ -1,4 +1,6 @@
+import os
 import pathlib
+from dotenv import load_dotenv
 
 # Define the marker file path
 DOCKER_ENV_MARKER = "/.dockerenv"
@@ -11,3 +13,19 @@ def running_from_docker_container() -> bool:
     """    
     return pathlib.Path(DOCKER_ENV_MARKER).exists()
 
+
+def get_env_variable(name:str, default:str = "") -> str:
+    """Read an environment variable, loading the .env file when running locally.
+
+    Args:
+        name (str): Name of the environment variable.
+        default (str, optional): Value used when the variable is unset or empty.
+         Defaults to "".
+
+    Returns:
+        str: Value of the environment variable.
+    """
+    if not running_from_docker_container():
+        load_dotenv()
+        return os.getenv(name) or default
+    return os.environ.get(name) or default
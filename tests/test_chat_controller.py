@@ -0,0 +1,89 @@
+import os
+
+import pytest
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from tandem_buddy import language_partner
+from tandem_buddy.chat_controller import ChatController
+
+
+class FakeAudioProcessing():
+    def __init__(self, fail_tts=False):
+        self.fail_tts = fail_tts
+
+    def speech_to_text(self, audio_data):
+        return "Ayer yo fui al parque"
+
+    def text_to_speech(self, text):
+        def stream():
+            if self.fail_tts:
+                yield b"partial"
+                raise ConnectionError("tts failed")
+            yield text.encode("utf-8")
+        return stream()
+
+    def save_audio_to_file(self, audio_data, filename):
+        with open(filename, "wb") as out_file:
+            if isinstance(audio_data, bytes):
+                out_file.write(audio_data)
+            else:
+                for chunk in audio_data:
+                    out_file.write(chunk)
+
+
+@pytest.fixture
+def controller(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("OPENAI_API_KEY", "test")
+    monkeypatch.setenv("ELEVENLABS_API_KEY", "test")
+    monkeypatch.setenv("ELEVENLABS_VOICE_ID", "voice")
+    monkeypatch.setenv("TANDEM_FILLER_ACKNOWLEDGEMENTS", "")
+    monkeypatch.setattr(language_partner, "ChatOpenAI",
+                        lambda model: FakeListChatModel(responses=["¡Qué bien!", "Feedback"]))
+
+    controller = ChatController()
+    controller.audio_processor = FakeAudioProcessing()
+    return controller
+
+
+def test_turn_is_stored_once(controller):
+    controller.process_conversation_turn(b"user audio")
+
+    assert len(controller._turns) == 1
+    assert [text for _, _, text in controller._turns.utterances()] == ["Ayer yo fui al parque", "¡Qué bien!"]
+    assert [message["content"] for message in controller._chatbot_messages()] == [
+        "🎤 User Audio Message #1",
+        {"path": "temp_data/user_audio_1.mp3"},
+        "🤖 Assistant Audio Message #1",
+        {"path": "temp_data/assistant_audio_1.mp3"},
+    ]
+
+
+def test_generate_feedback_does_not_write_history(controller):
+    controller.process_conversation_turn(b"user audio")
+    history = [message.content for message in controller.language_partner.chat_history.messages]
+
+    feedback = controller.generate_feedback()
+
+    assert "**Total Interactions:** 1 turns" in feedback
+    assert feedback.endswith("Feedback")
+    assert len(controller._turns) == 1
+    assert [message.content for message in controller.language_partner.chat_history.messages] == history
+
+
+def test_failed_tts_does_not_store_turn(controller):
+    controller.audio_processor = FakeAudioProcessing(fail_tts=True)
+
+    with pytest.raises(ConnectionError):
+        controller.process_conversation_turn(b"user audio")
+
+    assert len(controller._turns) == 0
+    assert controller._chatbot_messages() == []
+    assert not os.path.exists("temp_data/assistant_audio_1.mp3")
+
+
+def test_chatbot_view_skips_missing_audio(controller):
+    controller.process_conversation_turn(b"user audio")
+    os.unlink("temp_data/assistant_audio_1.mp3")
+
+    assert [message["role"] for message in controller._chatbot_messages()] == ["user", "user"]
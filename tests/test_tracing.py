@@ -0,0 +1,136 @@
+import os
+import time
+
+import pytest
+
+from tandem_buddy.tracing import Tracer, SlowTurnProfiler, turn_context, current_turn
+
+
+class CollectingExporter():
+    def __init__(self):
+        self.traces = []
+
+    def export(self, spans):
+        self.traces.append(spans)
+
+
+class FailingExporter():
+    def export(self, spans):
+        raise ConnectionError("collector down")
+
+
+def busy_wait(seconds):
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+
+
+@pytest.fixture
+def exporter():
+    return CollectingExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    return Tracer(exporter)
+
+
+def test_child_spans_are_linked_to_parent(tracer, exporter):
+    with tracer.start_span("conversation_turn") as root:
+        with tracer.start_span("stt") as child:
+            pass
+
+    tracer.flush()
+
+    assert len(exporter.traces) == 1
+    spans = {span.name: span for span in exporter.traces[0]}
+    assert spans["conversation_turn"] is root
+    assert spans["stt"] is child
+    assert root.parent_span_id is None
+    assert child.parent_span_id == root.span_id
+    assert child.trace_id == root.trace_id
+
+
+def test_trace_is_exported_once_root_span_ends(tracer, exporter):
+    with tracer.start_span("conversation_turn"):
+        with tracer.start_span("stt"):
+            pass
+        tracer.flush()
+        assert exporter.traces == []
+
+    tracer.flush()
+    assert len(exporter.traces) == 1
+
+
+def test_exception_marks_span_as_error(tracer, exporter):
+    with pytest.raises(ValueError):
+        with tracer.start_span("llm") as span:
+            raise ValueError("boom")
+
+    tracer.flush()
+
+    assert span.status == "error"
+    assert span.attributes["exception.type"] == "ValueError"
+    assert span.attributes["exception.message"] == "boom"
+    assert span.end_time_ns is not None
+
+
+def test_turn_context_ids_are_added_to_spans(tracer):
+    assert current_turn() == (None, None)
+
+    with turn_context("session-1", 3):
+        assert current_turn() == ("session-1", 3)
+        with tracer.start_span("tts", {"tts.text_length": 10}) as span:
+            pass
+
+    assert current_turn() == (None, None)
+    assert span.attributes == {"session.id": "session-1", "turn.id": 3, "tts.text_length": 10}
+
+
+def test_export_errors_do_not_fail_the_turn(capsys):
+    tracer = Tracer(FailingExporter())
+
+    with tracer.start_span("conversation_turn"):
+        pass
+
+    tracer.flush()
+
+    assert "collector down" in capsys.readouterr().out
+
+
+def test_disabled_tracer_yields_noop_span():
+    tracer = Tracer()
+
+    with tracer.start_span("stt") as span:
+        span.set_attribute("stt.text_length", 5)
+
+    assert not tracer.enabled
+
+
+def test_profiler_writes_profile_for_slow_turn(tracer, tmp_path):
+    profiler = SlowTurnProfiler(threshold_seconds=0.05, output_dir=str(tmp_path), interval_seconds=0.001)
+
+    with tracer.start_span("conversation_turn") as span:
+        with profiler.profile("session_turn_1", span):
+            busy_wait(0.1)
+
+    filename = os.path.join(str(tmp_path), "session_turn_1.folded")
+    assert span.attributes["profile.path"] == filename
+
+    with open(filename, encoding="utf-8") as profile_file:
+        lines = profile_file.read().splitlines()
+
+    assert lines
+    assert any("busy_wait" in line for line in lines)
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in lines)
+
+
+def test_profiler_skips_fast_turn(tracer, tmp_path):
+    profiler = SlowTurnProfiler(threshold_seconds=10, output_dir=str(tmp_path), interval_seconds=0.001)
+
+    with tracer.start_span("conversation_turn") as span:
+        with profiler.profile("session_turn_1", span):
+            busy_wait(0.02)
+
+    assert os.listdir(str(tmp_path)) == []
+    assert "profile.path" not in span.attributes
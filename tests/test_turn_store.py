@@ -0,0 +1,78 @@
+import pytest
+from langchain_core.messages import HumanMessage, AIMessage
+
+from tandem_buddy.turn_store import TurnStore
+
+
+@pytest.fixture
+def store():
+    store = TurnStore()
+    store.add_messages([HumanMessage(content="Hola, ¿qué tal?"), AIMessage(content="¡Muy bien!")])
+    store.add_messages([HumanMessage(content="Yo es estudiante"), AIMessage(content="Se dice 'yo soy'.")])
+    return store
+
+
+def test_len_counts_complete_turns():
+    store = TurnStore()
+    assert len(store) == 0
+
+    store.add_message(HumanMessage(content="Hola"))
+    assert len(store) == 0
+
+    store.add_message(AIMessage(content="¡Hola!"))
+    assert len(store) == 1
+
+
+def test_utterances_view(store):
+    assert list(store.utterances()) == [
+        (1, "user", "Hola, ¿qué tal?"),
+        (1, "assistant", "¡Muy bien!"),
+        (2, "user", "Yo es estudiante"),
+        (2, "assistant", "Se dice 'yo soy'."),
+    ]
+
+
+def test_messages_view(store):
+    messages = store.messages
+
+    assert [type(message) for message in messages] == [HumanMessage, AIMessage, HumanMessage, AIMessage]
+    assert [message.content for message in messages] == [
+        "Hola, ¿qué tal?", "¡Muy bien!", "Yo es estudiante", "Se dice 'yo soy'.",
+    ]
+
+
+def test_assistant_message_first_is_rejected():
+    store = TurnStore()
+
+    with pytest.raises(ValueError):
+        store.add_messages([AIMessage(content="¡Hola!")])
+
+    assert list(store.utterances()) == []
+
+
+def test_bad_batch_leaves_store_untouched(store):
+    with pytest.raises(ValueError):
+        store.add_messages([HumanMessage(content="Uno"), HumanMessage(content="Dos")])
+
+    assert len(store) == 2
+    assert len(list(store.utterances())) == 4
+
+
+def test_clear(store):
+    store.clear()
+
+    assert len(store) == 0
+    assert store.messages == []
+    assert list(store.utterances()) == []
+
+
+def test_remove_last_turn(store):
+    store.remove_last_turn()
+
+    assert len(store) == 1
+    assert [text for _, _, text in store.utterances()] == ["Hola, ¿qué tal?", "¡Muy bien!"]
+
+
+def test_remove_last_turn_of_empty_store():
+    with pytest.raises(ValueError):
+        TurnStore().remove_last_turn()